@@ -6,33 +6,64 @@
 #     python3 -m pip install -U pyinstaller PySide6 PySide6-WebEngine msal
 #     pyinstaller --windowed --onefile --name "SisumaaClient" launcher.py
 
-import sys, os, json, subprocess, base64, shutil, struct, socket, threading
+import sys, os, json, subprocess, base64, functools, shutil, struct, socket, time
 from pathlib import Path
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 
-from PySide6.QtCore import Qt, QUrl, QSize, QTimer, QPropertyAnimation, QEasingCurve, QObject, Signal
-from PySide6.QtGui import QPixmap, QFontDatabase, QFont, QDesktopServices, QColor, QMovie
+from PySide6.QtCore import (
+    Qt, QUrl, QSize, QTimer, QObject, Signal, QRunnable, QThreadPool, QEvent
+)
+from PySide6.QtGui import (
+    QPixmap, QFontDatabase, QFont, QDesktopServices, QColor, QMovie,
+    QImageReader, QPixmapCache
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
     QStackedWidget, QFileDialog, QMessageBox, QFrame, QComboBox, QCheckBox, QSlider, QLineEdit
 )
 
-# Optional WebEngine
-WEBENGINE_OK = True
-try:
-    from PySide6.QtWebEngineWidgets import QWebEngineView
-except Exception:
-    WEBENGINE_OK = False
-    QWebEngineView = None
+# Optional deps (WebEngine = Chromium, msal, requests) are imported lazily on
+# first use so launcher cold start doesn't pay for pages the user never opens.
+
+_WEBENGINE_VIEW = None  # None = not probed yet, False = unavailable
 
-# Optional MSAL (for Prism-style Device Login UI + token)
-MSAL_OK = True
+def _webengine_view():
+    global _WEBENGINE_VIEW
+    if _WEBENGINE_VIEW is None:
+        try:
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+            _WEBENGINE_VIEW = QWebEngineView
+        except Exception:
+            _WEBENGINE_VIEW = False
+    return _WEBENGINE_VIEW or None
+
+# Optional orjson: noticeably faster on the small payloads we parse/serialize
+# (Mojang textures blob, client config); stdlib json otherwise
 try:
-    import msal
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
 except Exception:
-    MSAL_OK = False
-    msal = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+_MSAL = None  # same probe pattern as WebEngine
+
+def _lazy_msal():
+    global _MSAL
+    if _MSAL is None:
+        try:
+            import msal
+            _MSAL = msal
+        except Exception:
+            _MSAL = False
+    return _MSAL or None
 
 APP_NAME = "Sisumaa Client ver 1.0"
 
@@ -64,39 +95,81 @@ SERVER_MAP = "http://82.141.114.148:28586/"
 CONFIG_FILE = "client_config.json"
 TOKEN_CACHE_FILE = "msal_token_cache.json"
 
+# Parsed once; QUrl validates on construction so click handlers shouldn't
+MSLINK_URL = "https://www.microsoft.com/link"
+_QURL_DISCORD = QUrl(DISCORD_INVITE)
+_QURL_MODRINTH = QUrl(MODRINTH_DISCOVER)
+_QURL_MAP = QUrl(SERVER_MAP)
+_QURL_MSLINK = QUrl(MSLINK_URL)
+
+# Sidebar navigation: (key, title, badge color)
+NAV_ITEMS = (
+    ("Home", "Home", "#55ffa4"),
+    ("Play", "Play", "#55ffa4"),
+    ("Skin", "Skin", "#ffbd40"),
+    ("Settings", "Settings", "#8fb3ff"),
+    ("Install", "Install", "#b8b8b8"),
+    ("Discord", "Discord", "#8b5cff"),
+    ("Mods", "Mods", "#ff6bd6"),
+    ("Login", "Login", "#55ffa4"),
+)
+
 
 # ------------------------- Paths / config -------------------------
 
+@functools.lru_cache(maxsize=1)
 def exe_dir() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys.executable).resolve().parent
     return Path(__file__).resolve().parent
 
+@functools.lru_cache(maxsize=128)
 def rel_path(name: str) -> Path:
-    # Prefer next to exe, fallback to script dir
-    p = exe_dir() / name
-    if p.exists():
-        return p
+    # Prefer next to exe, fallback to script dir (cached: asset locations
+    # don't move while the launcher runs). isfile on a str skips the Path
+    # construction + exception handling of Path.exists().
+    p = os.path.join(str(exe_dir()), name)
+    if os.path.isfile(p):
+        return Path(p)
     return Path(__file__).resolve().parent / name
 
+_CFG_CACHE: dict | None = None
+_CFG_WRITTEN: str | None = None  # last JSON actually on disk
+
 def load_config() -> dict:
+    global _CFG_CACHE, _CFG_WRITTEN
+    if _CFG_CACHE is not None:
+        return _CFG_CACHE
     p = exe_dir() / CONFIG_FILE
+    cfg = {}
     if p.exists():
         try:
-            return json.loads(p.read_text("utf-8"))
+            text = p.read_text("utf-8")
+            cfg = _json_loads(text)
+            _CFG_WRITTEN = text
         except Exception:
-            return {}
-    return {}
+            cfg = {}
+    _CFG_CACHE = cfg
+    return cfg
 
 def save_config(cfg: dict) -> None:
+    global _CFG_CACHE, _CFG_WRITTEN
+    _CFG_CACHE = cfg
+    data = _json_dumps(cfg)
+    if data == _CFG_WRITTEN:
+        return  # nothing changed, skip the disk write
     p = exe_dir() / CONFIG_FILE
     try:
-        p.write_text(json.dumps(cfg, indent=2), "utf-8")
+        # Write-then-rename so a crash mid-write never leaves a broken config
+        tmp = p.with_suffix(".tmp")
+        tmp.write_text(data, "utf-8")
+        os.replace(tmp, p)
+        _CFG_WRITTEN = data
     except Exception:
         pass
 
-def try_open_url(url: str):
-    QDesktopServices.openUrl(QUrl(url))
+def try_open_url(url: QUrl | str):
+    QDesktopServices.openUrl(url if isinstance(url, QUrl) else QUrl(url))
 
 def minecraft_dir() -> Path:
     # Windows default
@@ -106,29 +179,136 @@ def minecraft_dir() -> Path:
     # fallback
     return Path.home() / ".minecraft"
 
+@functools.lru_cache(maxsize=1)
 def mods_dir() -> Path:
+    # Cached: the mkdir probe only needs to happen once per session
     d = minecraft_dir() / "mods"
     d.mkdir(parents=True, exist_ok=True)
     return d
 
+# One pooled session per process: repeated Mojang/Modrinth calls reuse the
+# TCP+TLS connection instead of handshaking every time.
+_USER_AGENT = "SisumaaClient/1.0"
+_HTTP = None  # None = not probed yet, False = requests unavailable
+
+def _http_session():
+    global _HTTP
+    if _HTTP is None:
+        # Prefer httpx (HTTP/2 multiplexing: the Mojang hosts support it, so
+        # profile + sessionserver share one connection), then requests, then
+        # the plain urllib fallback in the helpers below
+        try:
+            import httpx
+            try:
+                _HTTP = httpx.Client(http2=True, headers={"User-Agent": _USER_AGENT})
+            except ImportError:
+                # h2 extra not installed; HTTP/1.1 keep-alive still pools
+                _HTTP = httpx.Client(headers={"User-Agent": _USER_AGENT})
+            return _HTTP
+        except Exception:
+            pass
+        try:
+            import requests
+            _HTTP = requests.Session()
+            _HTTP.headers["User-Agent"] = _USER_AGENT
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _HTTP.mount("https://", adapter)
+            _HTTP.mount("http://", adapter)
+        except Exception:
+            _HTTP = False
+    return _HTTP or None
+
+def _warm_dns():
+    # One-shot warm-up of the OS resolver cache for the skin-fetch hosts so
+    # the first "Load Online Skin" click doesn't pay the DNS round trips;
+    # the actual connections resolve through the OS as usual
+    for host in ("api.mojang.com", "sessionserver.mojang.com", "textures.minecraft.net"):
+        try:
+            socket.getaddrinfo(host, 443, type=socket.SOCK_STREAM)
+        except Exception:
+            pass
+
+# Built once; every request shares these instead of re-allocating header dicts
+_JSON_HEADERS = {"User-Agent": _USER_AGENT, "Accept": "application/json"}
+_BYTES_HEADERS = {"User-Agent": _USER_AGENT}
+
+def _with_retries(fn):
+    # Two quick retries on transient failures (network blips, 5xx); 4xx and
+    # other hard errors surface immediately
+    last = None
+    for delay in (0, 0.2, 0.8):
+        if delay:
+            time.sleep(delay)
+        try:
+            return fn()
+        except HTTPError as e:
+            if e.code < 500:
+                raise
+            last = e
+        except URLError as e:
+            last = e
+        except Exception as e:
+            # requests/httpx status errors carry .response.status_code
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status is not None and status < 500:
+                raise
+            last = e
+    raise last
+
 def _http_json(url: str, timeout=8) -> dict:
-    req = Request(url, headers={"User-Agent": "SisumaaClient/1.0"})
-    with urlopen(req, timeout=timeout) as r:
-        data = r.read()
-    return json.loads(data.decode("utf-8"))
+    sess = _http_session()
+    if sess is not None:
+        def get():
+            r = sess.get(url, timeout=timeout, headers={"Accept": "application/json"})
+            r.raise_for_status()
+            return r
+        return _with_retries(get).json()
+    def get():
+        req = Request(url, headers=_JSON_HEADERS)
+        with urlopen(req, timeout=timeout) as r:
+            return r.read()
+    return _json_loads(_with_retries(get))
 
 def _http_bytes(url: str, timeout=12) -> bytes:
-    req = Request(url, headers={"User-Agent": "SisumaaClient/1.0"})
-    with urlopen(req, timeout=timeout) as r:
-        return r.read()
+    sess = _http_session()
+    if sess is not None:
+        def get():
+            r = sess.get(url, timeout=timeout)
+            r.raise_for_status()
+            return r
+        return _with_retries(get).content
+    def get():
+        req = Request(url, headers=_BYTES_HEADERS)
+        with urlopen(req, timeout=timeout) as r:
+            # Preallocate when the server tells us the size: no growing-buffer
+            # copies while the skin PNG streams in
+            n = int(r.headers.get("Content-Length") or 0)
+            if n <= 0:
+                return r.read()
+            buf = bytearray(n)
+            mv = memoryview(buf)
+            got = 0
+            while got < n:
+                k = r.readinto(mv[got:])
+                if not k:
+                    break
+                got += k
+            return bytes(buf) if got == n else bytes(buf[:got])
+    return _with_retries(get)
 
 
 # ------------------------- Running installers -------------------------
 
+@functools.lru_cache(maxsize=1)
+def _java_path() -> str | None:
+    # which() walks the whole PATH (one stat per PATHEXT combo on Windows);
+    # the result doesn't change mid-session
+    return shutil.which("javaw") or shutil.which("java")
+
 def run_file(path: Path) -> bool:
     try:
         if path.suffix.lower() == ".jar":
-            java = shutil.which("javaw") or shutil.which("java")
+            java = _java_path()
             if not java:
                 QMessageBox.critical(None, "Java missing",
                                      "Java was not found.\nInstall Java (JRE/JDK) to run .jar installers.")
@@ -146,24 +326,33 @@ def run_file(path: Path) -> bool:
 # ------------------------- Minecraft status ping (1.7+) -------------------------
 # Minimal implementation (no external libs). Shows online/max + sample list (if server provides it).
 
+_PORT_STRUCT = struct.Struct(">H")
+
 def _pack_varint(value: int) -> bytes:
-    out = b""
+    out = bytearray()
     v = value & 0xFFFFFFFF
     while True:
         b = v & 0x7F
         v >>= 7
         if v:
-            out += bytes([b | 0x80])
+            out.append(b | 0x80)
         else:
-            out += bytes([b])
+            out.append(b)
             break
-    return out
+    return bytes(out)
 
-def _read_varint(sock: socket.socket) -> int:
+# Constant VarInts used in every handshake (packet id 0, protocol, next state)
+_VI_0 = _pack_varint(0)
+_VI_1 = _pack_varint(1)
+_VI_PROTO = _pack_varint(762)
+
+def _read_varint(f) -> int:
+    # f is a buffered reader (socket.makefile), so each read(1) hits the
+    # buffer instead of costing a recv syscall
     num_read = 0
     result = 0
     while True:
-        byte = sock.recv(1)
+        byte = f.read(1)
         if not byte:
             raise ConnectionError("EOF")
         value = byte[0] & 0x7F
@@ -175,6 +364,21 @@ def _read_varint(sock: socket.socket) -> int:
             break
     return result
 
+@functools.lru_cache(maxsize=8)
+def _build_handshake(host: str, port: int) -> bytes:
+    # Handshake + status request for a fixed (host, port) is constant bytes;
+    # encode once and replay on every poll
+    host_bytes = host.encode("utf-8")
+    data = b"".join((
+        _VI_0,
+        _VI_PROTO,
+        _pack_varint(len(host_bytes)),
+        host_bytes,
+        _PORT_STRUCT.pack(port),
+        _VI_1,  # next state: status
+    ))
+    return b"".join((_pack_varint(len(data)), data, _VI_1, _VI_0))
+
 def mc_status(host: str, port: int, timeout=2.5) -> dict:
     """
     Returns dict:
@@ -184,37 +388,24 @@ def mc_status(host: str, port: int, timeout=2.5) -> dict:
     try:
         s = socket.create_connection((host, port), timeout=timeout)
         s.settimeout(timeout)
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Handshake + status request go out in one sendall: one syscall,
+        # and no Nagle delay between the two packets.
+        s.sendall(_build_handshake(host, port))
 
-        # Handshake packet
-        protocol_version = 762  # 1.20.4-ish; server will still respond for status generally
-        host_bytes = host.encode("utf-8")
-        data = b"".join([
-            _pack_varint(0x00),
-            _pack_varint(protocol_version),
-            _pack_varint(len(host_bytes)),
-            host_bytes,
-            struct.pack(">H", port),
-            _pack_varint(1)  # next state: status
-        ])
-        packet = _pack_varint(len(data)) + data
-        s.sendall(packet)
-
-        # Status request packet
-        req = _pack_varint(1) + _pack_varint(0x00)
-        s.sendall(req)
-
-        # Read response
-        _ = _read_varint(s)              # length
-        pid = _read_varint(s)            # packet id
+        # Read response through one buffered reader (1-2 syscalls total
+        # instead of one recv per header byte)
+        f = s.makefile("rb", buffering=4096)
+        _ = _read_varint(f)              # length
+        pid = _read_varint(f)            # packet id
         if pid != 0x00:
             raise ValueError(f"Unexpected packet id {pid}")
-        str_len = _read_varint(s)
-        raw = b""
-        while len(raw) < str_len:
-            chunk = s.recv(str_len - len(raw))
-            if not chunk:
-                break
-            raw += chunk
+        str_len = _read_varint(f)
+        raw = f.read(str_len)
+        if len(raw) < str_len:
+            raise ConnectionError("EOF")
+        f.close()
         s.close()
 
         j = json.loads(raw.decode("utf-8", "replace"))
@@ -238,39 +429,70 @@ def mc_status(host: str, port: int, timeout=2.5) -> dict:
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
+# TTL cache so Home + Play (and anything else) share one ping instead of
+# each doing a full handshake.
+_STATUS_CACHE: dict[tuple, tuple[float, dict]] = {}
+
+def mc_status_cached(host: str, port: int, ttl: float = 10.0) -> dict:
+    key = (host, port)
+    hit = _STATUS_CACHE.get(key)
+    now = time.monotonic()
+    if hit and (now - hit[0]) < ttl:
+        return hit[1]
+    st = mc_status(host, port)
+    _STATUS_CACHE[key] = (now, st)
+    return st
+
 
 # ------------------------- Minecraft launcher detection -------------------------
 
-def detect_minecraft_launchers() -> list[Path]:
-    candidates: list[Path] = []
+def _iter_minecraft_launchers():
+    # Generator so callers that only need the first hit (play_minecraft)
+    # stop probing the filesystem as soon as one exists
     env = os.environ
     programfiles = Path(env.get("ProgramFiles", r"C:\Program Files"))
     programfilesx86 = Path(env.get("ProgramFiles(x86)", r"C:\Program Files (x86)"))
 
     # Legacy launcher locations
-    candidates += [
+    candidates = [
         programfilesx86 / "Minecraft Launcher" / "MinecraftLauncher.exe",
         programfiles / "Minecraft Launcher" / "MinecraftLauncher.exe",
         programfilesx86 / "Minecraft Launcher" / "Minecraft.exe",
         programfiles / "Minecraft Launcher" / "Minecraft.exe",
     ]
 
-    # XboxGames common roots
+    # XboxGames common roots (only descend into roots that exist; probing
+    # absent D:/E: drives can stall on spun-down removable media)
     for root in [Path("C:/XboxGames"), Path("D:/XboxGames"), Path("E:/XboxGames")]:
+        if not root.is_dir():
+            continue
         candidates += [
             root / "Minecraft Launcher_1" / "Content" / "Minecraft.exe",
             root / "Minecraft Launcher" / "Content" / "Minecraft.exe",
         ]
 
-    out = [p for p in candidates if p.exists()]
     seen = set()
-    uniq = []
-    for p in out:
+    for p in candidates:
         k = str(p).lower()
-        if k not in seen:
-            uniq.append(p)
+        if k not in seen and p.exists():
             seen.add(k)
-    return uniq
+            yield p
+
+@functools.lru_cache(maxsize=1)
+def detect_minecraft_launchers() -> list[Path]:
+    # Cached: installed launchers don't move during a session
+    return list(_iter_minecraft_launchers())
+
+@functools.lru_cache(maxsize=1)
+def _has_mc_protocol() -> bool:
+    # Windows: only worth attempting os.startfile("minecraft-launcher:")
+    # if the protocol handler is actually registered
+    try:
+        import winreg
+        with winreg.OpenKey(winreg.HKEY_CLASSES_ROOT, "minecraft-launcher"):
+            return True
+    except Exception:
+        return False
 
 
 # ------------------------- UI components -------------------------
@@ -283,30 +505,24 @@ class NavButton(QPushButton):
         self.setMinimumHeight(46)
         self.setObjectName("navBtn")
         self._active = False
-
-        self.anim = QPropertyAnimation(self, b"minimumWidth")
-        self.anim.setDuration(140)
-        self.anim.setEasingCurve(QEasingCurve.OutCubic)
+        self._style = self.style()
 
     def set_active(self, active: bool):
         self._active = active
         self.setProperty("active", active)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        # polish alone re-resolves the [active=...] selector; unpolish is only
+        # needed when a dynamic property is removed, not toggled
+        self._style.polish(self)
         self.update()
 
+    # No per-button QPropertyAnimation: 8 animators ticking on hover isn't
+    # worth it, the width snap reads fine with the hover border highlight
     def enterEvent(self, e):
-        self.anim.stop()
-        self.anim.setStartValue(self.minimumWidth())
-        self.anim.setEndValue(260)
-        self.anim.start()
+        self.setMinimumWidth(260)
         super().enterEvent(e)
 
     def leaveEvent(self, e):
-        self.anim.stop()
-        self.anim.setStartValue(self.minimumWidth())
-        self.anim.setEndValue(240)
-        self.anim.start()
+        self.setMinimumWidth(240)
         super().leaveEvent(e)
 
 class ColorButton(QPushButton):
@@ -341,7 +557,8 @@ class _AuthWorker(QObject):
         self.client_id = client_id
 
     def run_device_flow(self):
-        if not MSAL_OK:
+        msal = _lazy_msal()
+        if msal is None:
             self.finished.emit({"ok": False, "error": "msal_missing"})
             return
         try:
@@ -365,7 +582,7 @@ class _AuthWorker(QObject):
                 return
 
             self.progress.emit(flow["user_code"])
-            try_open_url("https://www.microsoft.com/link")
+            try_open_url(_QURL_MSLINK)
 
             result = app.acquire_token_by_device_flow(flow)
 
@@ -381,6 +598,67 @@ class _AuthWorker(QObject):
             self.finished.emit({"ok": False, "error": str(e)})
 
 
+class _SkinWorker(QObject):
+    finished = Signal(dict)
+
+    def __init__(self, name: str):
+        super().__init__()
+        self.name = name
+
+    def run(self):
+        try:
+            # All three fetches (profile, sessionserver, skin PNG) ride the
+            # pooled session from _http_session(), so only the first call to
+            # each host pays a TCP+TLS handshake
+            prof = _http_json(f"https://api.mojang.com/users/profiles/minecraft/{self.name}")
+            uuid = prof.get("id")
+            if not uuid:
+                self.finished.emit({"ok": False, "title": "Not found", "error": "Username not found on Mojang."})
+                return
+            # sessionserver profile with textures
+            sprof = _http_json(f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid}")
+            props = sprof.get("properties") or []
+            tex = None
+            for p in props:
+                if p.get("name") == "textures":
+                    tex = p.get("value")
+                    break
+            if not tex:
+                self.finished.emit({"ok": False, "title": "No textures", "error": "No textures found for this user."})
+                return
+
+            # both orjson and stdlib json accept bytes; no decode needed
+            data = _json_loads(base64.b64decode(tex + "=="))
+            skin_url = (((data.get("textures") or {}).get("SKIN") or {}).get("url"))
+            if not skin_url:
+                self.finished.emit({"ok": False, "title": "No skin", "error": "No skin URL found."})
+                return
+
+            png = _http_bytes(skin_url)
+            b64 = base64.b64encode(png).decode("ascii")
+            self.finished.emit({"ok": True, "name": self.name, "uuid": uuid, "png": png, "b64": b64})
+        except HTTPError as e:
+            self.finished.emit({"ok": False, "title": "HTTP error", "error": str(e)})
+        except URLError as e:
+            self.finished.emit({"ok": False, "title": "Network error", "error": str(e)})
+        except Exception as e:
+            self.finished.emit({"ok": False, "title": "Error", "error": str(e)})
+
+
+class _CallTask(QRunnable):
+    # Runs any zero-arg callable on the shared thread pool (status pings,
+    # device flow, ...) so the GUI never blocks on sockets.
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def run(self):
+        self.fn()
+
+
+class _StatusBridge(QObject):
+    done = Signal(dict)
+
 
 # ------------------------- Main window -------------------------
 
@@ -390,16 +668,39 @@ class Launcher(QMainWindow):
         self.setWindowTitle(APP_NAME)
         self.resize(1200, 760)
         self.cfg = load_config()
+        self._last_online_skin_png = b""
+        self._pending_skin_url = None
+        self._web_loaded = False
+
+        self.pool = QThreadPool.globalInstance()
+        self.pool.setMaxThreadCount(4)
+        self._status_bridge = _StatusBridge()
+        self._status_bridge.done.connect(self._apply_status)
+
+        # Debounced config writes: bursty mutations (login finish, skin load)
+        # collapse into one disk write; closeEvent flushes whatever is pending
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(lambda: save_config(self.cfg))
 
         self._load_font()
         self._build_ui()
-        self._apply_styles()
+
+        # Non-blocking toast for success messages (modal QMessageBox pumps
+        # its own event loop and holds up the next click)
+        self._toast = QLabel(self)
+        self._toast.setObjectName("toast")
+        self._toast.hide()
+        self._toast_timer = QTimer(self)
+        self._toast_timer.setSingleShot(True)
+        self._toast_timer.timeout.connect(self._toast.hide)
 
         self.switch_tab("Home")
         self._start_status_updates()
-
-        # if we have previously applied skin locally, show it immediately in viewer
-        self._try_load_applied_skin_on_start()
+        self.pool.start(_CallTask(_warm_dns))
+        # previously applied skin is restored in _ensure_web() once the
+        # viewer actually exists
 
     # ----- font/background -----
 
@@ -414,16 +715,26 @@ class Launcher(QMainWindow):
             self.setFont(QFont("Segoe UI", 10))
 
     def _refresh_background(self):
-        bg_path = rel_path(ASSET_BG)
-        if bg_path.exists():
-            pix = QPixmap(str(bg_path))
-            self.bg.setPixmap(pix.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
+        # Decode the BMP once; every refresh only rescales the cached pixmap
+        if not hasattr(self, "_bg_pix"):
+            bg_path = rel_path(ASSET_BG)
+            self._bg_pix = QPixmap(str(bg_path)) if bg_path.exists() else QPixmap()
+        if not self._bg_pix.isNull():
+            self.bg.setPixmap(self._bg_pix.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation))
         else:
             self.bg.setPixmap(QPixmap())
         self.bg.setGeometry(0, 0, self.width(), self.height())
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
+        # Debounce: during a window drag this fires dozens of times, one
+        # smooth rescale per frame is plenty
+        if not getattr(self, "_bg_resize_pending", False):
+            self._bg_resize_pending = True
+            QTimer.singleShot(16, self._apply_bg_resize)
+
+    def _apply_bg_resize(self):
+        self._bg_resize_pending = False
         self._refresh_background()
 
     # ----- UI -----
@@ -452,32 +763,30 @@ class Launcher(QMainWindow):
         self.logo.setAlignment(Qt.AlignCenter)
         lp = rel_path(ASSET_LOGO)
         if lp.exists():
-            pix = QPixmap(str(lp))
-            self.logo.setPixmap(pix.scaled(140, 140, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            # Let the decoder produce the 140x140 image directly instead of
+            # decoding full-res and downsampling in software
+            reader = QImageReader(str(lp))
+            src = reader.size()
+            target = QSize(140, 140)
+            if src.isValid():
+                target = src.scaled(target, Qt.KeepAspectRatio)
+            reader.setScaledSize(target)
+            self.logo.setPixmap(QPixmap.fromImage(reader.read()))
         else:
             self.logo.setText("Logo missing")
         side.addWidget(self.logo)
 
         self.btns: dict[str, NavButton] = {}
-        def add_nav(key: str, title: str, color: str):
+        for key, title, color in NAV_ITEMS:
+            if key == "Login":
+                # keep your nav buttons, add stretch, then put Login at the bottom-left as requested
+                side.addStretch(1)
             b = NavButton(title, color)
             b.setMinimumWidth(240)
-            b.clicked.connect(lambda _, k=key: self.switch_tab(k))
+            b.clicked.connect(functools.partial(self.switch_tab, key))
             self.btns[key] = b
             side.addWidget(b)
 
-        add_nav("Home", "Home", "#55ffa4")
-        add_nav("Play", "Play", "#55ffa4")
-        add_nav("Skin", "Skin", "#ffbd40")
-        add_nav("Settings", "Settings", "#8fb3ff")
-        add_nav("Install", "Install", "#b8b8b8")
-        add_nav("Discord", "Discord", "#8b5cff")
-        add_nav("Mods", "Mods", "#ff6bd6")
-
-        # keep your nav buttons, add stretch, then put Login at the bottom-left as requested
-        side.addStretch(1)
-        add_nav("Login", "Login", "#55ffa4")
-
         root_lay.addWidget(self.sidebar, 0)
 
         # Content stack
@@ -557,11 +866,11 @@ class Launcher(QMainWindow):
         btn_row.addWidget(self.btn_server)
 
         self.btn_map = ColorButton("Open BlueMap", "btnMap")
-        self.btn_map.clicked.connect(lambda: try_open_url(SERVER_MAP))
+        self.btn_map.clicked.connect(lambda: try_open_url(_QURL_MAP))
         btn_row.addWidget(self.btn_map)
 
         self.btn_join = ColorButton("Join Discord", "btnDiscord")
-        self.btn_join.clicked.connect(lambda: try_open_url(DISCORD_INVITE))
+        self.btn_join.clicked.connect(lambda: try_open_url(_QURL_DISCORD))
         btn_row.addWidget(self.btn_join)
 
         card.body.addLayout(btn_row)
@@ -602,7 +911,7 @@ class Launcher(QMainWindow):
         btn_row.addWidget(b2)
 
         b3 = ColorButton("Open BlueMap", "btnMap")
-        b3.clicked.connect(lambda: try_open_url(SERVER_MAP))
+        b3.clicked.connect(lambda: try_open_url(_QURL_MAP))
         btn_row.addWidget(b3)
 
         card.body.addLayout(btn_row)
@@ -666,19 +975,10 @@ class Launcher(QMainWindow):
         wrap_lay = QVBoxLayout(wrap)
         wrap_lay.setContentsMargins(0, 0, 0, 0)
 
-        if WEBENGINE_OK:
-            self.web = QWebEngineView()
-            self.web.setObjectName("webview")
-            self.web.setAttribute(Qt.WA_TranslucentBackground, True)
-            self.web.page().setBackgroundColor(QColor(0, 0, 0, 0))
-            self.web.setHtml(self._skin_html(None))
-            wrap_lay.addWidget(self.web, 1)
-        else:
-            self.web = None
-            msg = QLabel("3D viewer needs PySide6-WebEngine.\nInstall: python -m pip install PySide6-WebEngine")
-            msg.setObjectName("muted")
-            msg.setAlignment(Qt.AlignCenter)
-            wrap_lay.addWidget(msg, 1)
+        # The QWebEngineView (a full Chromium) is created on first visit to
+        # this page via _ensure_web(), not at startup
+        self.web = None
+        self._viewer_wrap_lay = wrap_lay
 
         card.body.addWidget(wrap, 1)
 
@@ -803,7 +1103,7 @@ class Launcher(QMainWindow):
         card.body.addWidget(txt)
 
         btn = ColorButton("Open Discord Invite", "btnPurple")
-        btn.clicked.connect(lambda: try_open_url(DISCORD_INVITE))
+        btn.clicked.connect(lambda: try_open_url(_QURL_DISCORD))
         card.body.addWidget(btn)
 
         lay.addWidget(card)
@@ -833,18 +1133,10 @@ class Launcher(QMainWindow):
         row.addStretch(1)
         card.body.addLayout(row)
 
-        if WEBENGINE_OK:
-            self.mods_web = QWebEngineView()
-            self.mods_web.setObjectName("webview")
-            self.mods_web.setUrl(QUrl(MODRINTH_DISCOVER))
-            card.body.addWidget(self.mods_web, 1)
-        else:
-            msg = QLabel("Embedded Modrinth needs PySide6-WebEngine.\nOpen in browser instead.")
-            msg.setObjectName("muted")
-            card.body.addWidget(msg)
-            btn = ColorButton("Open Modrinth in Browser", "btnPink")
-            btn.clicked.connect(lambda: try_open_url(MODRINTH_DISCOVER))
-            card.body.addWidget(btn)
+        # Embedded Modrinth view is created on first visit via
+        # _ensure_mods_web(), so startup doesn't load modrinth.com
+        self.mods_web = None
+        self._mods_body = card.body
 
         lay.addWidget(card, 1)
         return w
@@ -883,7 +1175,7 @@ class Launcher(QMainWindow):
         row.addWidget(b_start, 0)
 
         b_open = ColorButton("Open device login page", "btnGrey")
-        b_open.clicked.connect(lambda: try_open_url("https://www.microsoft.com/link"))
+        b_open.clicked.connect(lambda: try_open_url(_QURL_MSLINK))
         row.addWidget(b_open, 0)
 
         row.addStretch(1)
@@ -895,15 +1187,101 @@ class Launcher(QMainWindow):
 
     # ----- actions -----
 
-    def switch_tab(self, key: str):
+    def _ensure_web(self):
+        # Spin up Chromium the first time the Skin page is shown; startup
+        # stays ~100 MB lighter for users who never open it
+        if self.web is not None or getattr(self, "_web_unavailable", False):
+            return
+        View = _webengine_view()
+        if View is None:
+            self._web_unavailable = True
+            msg = QLabel("3D viewer needs PySide6-WebEngine.\nInstall: python -m pip install PySide6-WebEngine")
+            msg.setObjectName("muted")
+            msg.setAlignment(Qt.AlignCenter)
+            self._viewer_wrap_lay.addWidget(msg, 1)
+            return
+        self.web = View()
+        self.web.setObjectName("webview")
+        self.web.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.web.page().setBackgroundColor(QColor(0, 0, 0, 0))
+        self.web.loadFinished.connect(self._on_viewer_loaded)
+        # Local baseUrl: without it Chromium treats the page as a data:
+        # document and refuses file:// skins and the bundled skinview3d js
+        self.web.setHtml(self._skin_html(None), QUrl.fromLocalFile(str(exe_dir()) + os.sep))
+        self._viewer_wrap_lay.addWidget(self.web, 1)
+        # now that the viewer exists, show the previously applied skin
+        self._try_load_applied_skin_on_start()
+
+    def _ensure_mods_web(self):
+        # Same lazy pattern as the skin viewer: Modrinth only loads (and
+        # Chromium only spins up) when the Mods page is actually opened
+        if self.mods_web is not None or getattr(self, "_mods_web_unavailable", False):
+            return
+        View = _webengine_view()
+        if View is None:
+            self._mods_web_unavailable = True
+            msg = QLabel("Embedded Modrinth needs PySide6-WebEngine.\nOpen in browser instead.")
+            msg.setObjectName("muted")
+            self._mods_body.addWidget(msg)
+            btn = ColorButton("Open Modrinth in Browser", "btnPink")
+            btn.clicked.connect(lambda: try_open_url(_QURL_MODRINTH))
+            self._mods_body.addWidget(btn)
+            return
+        self.mods_web = View()
+        self.mods_web.setObjectName("webview")
+        self.mods_web.setUrl(_QURL_MODRINTH)
+        self._mods_body.addWidget(self.mods_web, 1)
+
+    def switch_tab(self, key: str, *_):
         for k, b in self.btns.items():
             b.set_active(k == key)
+        if key == "Skin":
+            self._ensure_web()
+        elif key == "Mods":
+            self._ensure_mods_web()
         self.stack.setCurrentWidget(self.pages[key])
+        # Don't keep decoding GIF frames while Home is hidden
+        if hasattr(self, "movie"):
+            self.movie.setPaused(key != "Home")
+        # Status polling only matters on pages that show it
+        if hasattr(self, "timer"):
+            if self._status_tab_active():
+                if not self.timer.isActive():
+                    self.timer.setInterval(self._status_base_interval)
+                    self.timer.start()
+                    self._update_status()
+            else:
+                self.timer.stop()
+
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if e.type() == QEvent.WindowStateChange and hasattr(self, "timer"):
+            if self.isMinimized():
+                self.timer.stop()
+            elif self._status_tab_active() and not self.timer.isActive():
+                self.timer.start()
+
+    def _schedule_save(self):
+        self._save_timer.start()
+
+    def closeEvent(self, e):
+        self._save_timer.stop()
+        save_config(self.cfg)  # flush anything still debounced
+        super().closeEvent(e)
+
+    def _toast_show(self, text: str, ms: int = 2000):
+        self._toast.setText(text)
+        self._toast.adjustSize()
+        self._toast.move(self.width() - self._toast.width() - 30,
+                         self.height() - self._toast.height() - 30)
+        self._toast.show()
+        self._toast.raise_()
+        self._toast_timer.start(ms)
 
     def copy_ip(self, show_msg=False):
         QApplication.clipboard().setText(SERVER_ADDR)
         if show_msg:
-            QMessageBox.information(self, "Copied", f"Copied:\n{SERVER_ADDR}")
+            self._toast_show(f"Copied: {SERVER_ADDR}")
 
     def install_file(self, filename: str):
         p = rel_path(filename)
@@ -914,25 +1292,34 @@ class Launcher(QMainWindow):
         run_file(p)
 
     def play_minecraft(self):
-        # Try direct exe paths
-        found = detect_minecraft_launchers()
-        if found:
+        # Try the exe that worked last time, then probe known locations
+        # (stopping at the first hit)
+        first = None
+        cached = self.cfg.get("cached_mc_launcher_path")
+        if cached and Path(cached).exists():
+            first = Path(cached)
+        else:
+            first = next(_iter_minecraft_launchers(), None)
+        if first:
             try:
-                subprocess.Popen([str(found[0])], cwd=str(found[0].parent))
+                subprocess.Popen([str(first)], cwd=str(first.parent))
+                self.cfg["cached_mc_launcher_path"] = str(first)
+                self._schedule_save()
                 if self.cfg.get("close_on_launch"):
                     self.close()
                 return
             except Exception:
                 pass
 
-        # Try protocol
-        try:
-            os.startfile("minecraft-launcher:")
-            if self.cfg.get("close_on_launch"):
-                self.close()
-            return
-        except Exception:
-            pass
+        # Try protocol (skipped entirely when the handler isn't registered)
+        if _has_mc_protocol():
+            try:
+                os.startfile("minecraft-launcher:")
+                if self.cfg.get("close_on_launch"):
+                    self.close()
+                return
+            except Exception:
+                pass
 
         QMessageBox.critical(self, "Minecraft not found",
                              "Minecraft Launcher was not found.\n\nOpening Microsoft Store search…")
@@ -944,8 +1331,8 @@ class Launcher(QMainWindow):
         self.cfg["fullscreen"] = bool(self.fullscreen.isChecked())
         self.cfg["close_on_launch"] = bool(self.close_on_launch.isChecked())
         self.cfg["ram_gb"] = int(self.ram.value())
-        save_config(self.cfg)
-        QMessageBox.information(self, "Saved", "Settings saved.")
+        self._schedule_save()
+        self._toast_show("Settings saved.")
 
     # ----- mods install -----
 
@@ -968,21 +1355,49 @@ class Launcher(QMainWindow):
         try:
             target = mods_dir() / Path(file).name
             shutil.copy(file, target)
-            QMessageBox.information(self, "Mod installed", f"Installed:\n{target}")
+            self._toast_show(f"Mod installed:\n{target}")
         except Exception as e:
             QMessageBox.critical(self, "Install failed", str(e))
 
     # ----- server status updates -----
 
     def _start_status_updates(self):
-        self._update_status()
+        # Poll fast while the user is watching, back off when nothing changes,
+        # and stop entirely while minimized or on a page without status labels
+        self._status_base_interval = 5_000
+        self._status_max_interval = 60_000
+        self._last_status_key = None
         self.timer = QTimer(self)
-        self.timer.setInterval(10_000)  # 10s
+        self.timer.setInterval(self._status_base_interval)
         self.timer.timeout.connect(self._update_status)
-        self.timer.start()
+        self._update_status()
+        if self._status_tab_active():
+            self.timer.start()
+
+    def _status_tab_active(self) -> bool:
+        cur = self.stack.currentWidget()
+        return not self.isMinimized() and cur in (self.pages["Home"], self.pages["Play"])
 
     def _update_status(self):
-        st = mc_status(SERVER_HOST, SERVER_PORT)
+        # Socket work happens on the pool; labels update back on the GUI
+        # thread. Skip the tick if the previous ping is still in flight
+        # (server timeouts can outlast the poll interval).
+        if getattr(self, "_status_in_flight", False):
+            return
+        self._status_in_flight = True
+        ttl = max(2.0, self.timer.interval() / 1000 * 0.9)
+        self.pool.start(_CallTask(
+            lambda: self._status_bridge.done.emit(mc_status_cached(SERVER_HOST, SERVER_PORT, ttl=ttl))
+        ))
+
+    def _apply_status(self, st: dict):
+        self._status_in_flight = False
+        key = (st.get("ok"), st.get("online"), st.get("max"), tuple(st.get("sample") or ()))
+        if key == self._last_status_key:
+            self.timer.setInterval(min(self._status_max_interval, self.timer.interval() * 2))
+        else:
+            self._last_status_key = key
+            self.timer.setInterval(self._status_base_interval)
         if st.get("ok"):
             online = st["online"]
             maxp = st["max"]
@@ -1003,12 +1418,15 @@ class Launcher(QMainWindow):
 
     def _skin_html(self, skin_b64: str | None) -> str:
         skin = "null" if not skin_b64 else f'"data:image/png;base64,{skin_b64}"'
+        # Prefer a bundled skinview3d next to the launcher; fall back to unpkg
+        local_js = rel_path("skinview3d.bundle.js")
+        js_src = local_js.as_uri() if local_js.exists() else "https://unpkg.com/skinview3d/bundles/skinview3d.bundle.js"
         return f"""
 <!doctype html>
 <html>
 <head>
   <meta charset="utf-8"/>
-  <script src="https://unpkg.com/skinview3d/bundles/skinview3d.bundle.js"></script>
+  <script src="{js_src}"></script>
   <style>
     html, body {{
       margin:0; padding:0; width:100%; height:100%;
@@ -1050,11 +1468,35 @@ class Launcher(QMainWindow):
       const ns = size();
       viewer.setSize(ns.w, ns.h);
     }});
+
+    // Skin swaps come in via runJavaScript (after loadFinished) so the page
+    // (and the ~150 kB skinview3d bundle + WebGL context) loads only once.
+    window.__setSkin = (u) => viewer.loadSkin(u);
   </script>
 </body>
 </html>
 """
 
+    def _set_skin_url(self, url: str):
+        # Remember the URL on the Python side and only push it once the
+        # viewer page has finished loading: runJavaScript against a still-
+        # committing navigation runs in the old document and is lost.
+        # Prefer file:// URLs: Chromium stream-decodes the PNG from disk
+        # instead of re-tokenizing an inlined base64 blob.
+        self._pending_skin_url = url
+        if getattr(self, "web", None) and self._web_loaded:
+            self.web.page().runJavaScript(f"window.__setSkin({json.dumps(url)})")
+
+    def _on_viewer_loaded(self, ok: bool):
+        self._web_loaded = bool(ok)
+        if ok and self._pending_skin_url:
+            self.web.page().runJavaScript(
+                f"window.__setSkin({json.dumps(self._pending_skin_url)})"
+            )
+
+    def _set_skin_b64(self, b64: str):
+        self._set_skin_url(f"data:image/png;base64,{b64}")
+
     def _try_load_applied_skin_on_start(self):
         try:
             p = self.cfg.get("applied_skin_path")
@@ -1063,11 +1505,11 @@ class Launcher(QMainWindow):
             fp = Path(p)
             if not fp.exists():
                 return
-            if not (WEBENGINE_OK and getattr(self, "web", None)):
+            if not getattr(self, "web", None):
                 return
-            with open(fp, "rb") as f:
-                b64 = base64.b64encode(f.read()).decode("ascii")
-            self.web.setHtml(self._skin_html(b64))
+            # Startup restore is a single JS call on the already-saved PNG;
+            # no base64 round trip (the viewer reads the file directly)
+            self._set_skin_url(fp.as_uri())
             self.skin_path.setText(str(fp))
         except Exception:
             pass
@@ -1081,83 +1523,89 @@ class Launcher(QMainWindow):
             return
         self.skin_path.setText(path)
 
-        if not (WEBENGINE_OK and self.web):
+        if not self.web:
             return
 
         try:
-            with open(path, "rb") as f:
-                b64 = base64.b64encode(f.read()).decode("ascii")
-            self.web.setHtml(self._skin_html(b64))
+            self._set_skin_url(Path(path).as_uri())
         except Exception as e:
             QMessageBox.critical(self, "Skin error", str(e))
 
     def load_online_skin(self):
+        # Launch-and-return like start_device_login: the three HTTP calls run
+        # on the pool so the UI never freezes on TLS handshakes or downloads
         name = (self.online_name.text() or "").strip()
         if not name:
             QMessageBox.information(self, "Missing", "Enter a username first.")
             return
+        self.skin_path.setText(f"Loading: {name}…")
+        self.skin_worker = _SkinWorker(name)
+        self.skin_worker.finished.connect(self._on_online_skin_loaded)
+        self.pool.start(_CallTask(self.skin_worker.run))
+
+    def _on_online_skin_loaded(self, payload: dict):
+        if not payload.get("ok"):
+            self.skin_path.setText("")
+            QMessageBox.critical(self, payload.get("title", "Error"), str(payload.get("error", "unknown")))
+            return
+        name = payload["name"]
+        b64 = payload["b64"]
+        # Keep the raw PNG in memory (and a small disk cache) for Apply;
+        # no giant base64 blob in client_config.json anymore
+        self._last_online_skin_png = payload["png"]
+        self.cfg["last_online_skin_username"] = name
+        self.cfg.pop("last_online_skin_png_b64", None)  # drop legacy blob
+        skin_url = None
         try:
-            prof = _http_json(f"https://api.mojang.com/users/profiles/minecraft/{name}")
-            uuid = prof.get("id")
-            if not uuid:
-                QMessageBox.critical(self, "Not found", "Username not found on Mojang.")
-                return
-            # sessionserver profile with textures
-            sprof = _http_json(f"https://sessionserver.mojang.com/session/minecraft/profile/{uuid}")
-            props = sprof.get("properties") or []
-            tex = None
-            for p in props:
-                if p.get("name") == "textures":
-                    tex = p.get("value")
-                    break
-            if not tex:
-                QMessageBox.critical(self, "No textures", "No textures found for this user.")
-                return
-
-            data = json.loads(base64.b64decode(tex + "==").decode("utf-8", "replace"))
-            skin_url = (((data.get("textures") or {}).get("SKIN") or {}).get("url"))
-            if not skin_url:
-                QMessageBox.critical(self, "No skin", "No skin URL found.")
-                return
-
-            png = _http_bytes(skin_url)
-            b64 = base64.b64encode(png).decode("ascii")
-            self.cfg["last_online_skin_username"] = name
-            self.cfg["last_online_skin_png_b64"] = b64  # stored for Apply
-            save_config(self.cfg)
+            cache_dir = exe_dir() / ".cache"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file = cache_dir / f"{payload['uuid']}.png"
+            cache_file.write_bytes(payload["png"])
+            self.cfg["last_online_skin_png_path"] = str(cache_file)
+            skin_url = cache_file.as_uri()
+        except Exception:
+            pass
+        self._schedule_save()
 
-            self.skin_path.setText(f"Online: {name}")
-            if WEBENGINE_OK and self.web:
-                self.web.setHtml(self._skin_html(b64))
-        except HTTPError as e:
-            QMessageBox.critical(self, "HTTP error", str(e))
-        except URLError as e:
-            QMessageBox.critical(self, "Network error", str(e))
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+        self.skin_path.setText(f"Online: {name}")
+        if skin_url:
+            self._set_skin_url(skin_url)
+        else:
+            # cache dir not writable; fall back to an inline data URL
+            self._set_skin_b64(b64)
 
     def apply_online_skin_locally(self):
         # Save last loaded online skin to launcher folder and remember it in config
-        b64 = self.cfg.get("last_online_skin_png_b64")
         name = self.cfg.get("last_online_skin_username") or "skin"
-        if not b64:
+        raw = self._last_online_skin_png
+        if not raw:
+            # fall back to the on-disk cache from a previous session
+            cached = self.cfg.get("last_online_skin_png_path")
+            if cached and Path(cached).exists():
+                raw = Path(cached).read_bytes()
+        if not raw:
+            # legacy configs still carry the base64 blob
+            b64 = self.cfg.get("last_online_skin_png_b64")
+            if b64:
+                raw = base64.b64decode(b64)
+        if not raw:
             QMessageBox.information(self, "Missing", "Load an online skin first.")
             return
         try:
             skins_folder = exe_dir() / "skins"
             skins_folder.mkdir(parents=True, exist_ok=True)
             out = skins_folder / f"{name}.png"
-            out.write_bytes(base64.b64decode(b64))
+            out.write_bytes(raw)
             self.cfg["applied_skin_path"] = str(out)
-            save_config(self.cfg)
-            QMessageBox.information(self, "Saved", f"Saved locally:\n{out}")
+            self._schedule_save()
+            self._toast_show(f"Saved locally:\n{out}")
         except Exception as e:
             QMessageBox.critical(self, "Save failed", str(e))
 
     # ----- login -----
 
     def start_device_login(self):
-        if not MSAL_OK:
+        if _lazy_msal() is None:
             QMessageBox.information(self, "msal missing",
                                     "MSAL is not installed.\n\nInstall:\npython -m pip install msal")
             return
@@ -1169,8 +1617,7 @@ class Launcher(QMainWindow):
         self.auth_worker.progress.connect(self._show_code)
         self.auth_worker.finished.connect(self._on_auth_finished)
 
-        t = threading.Thread(target=self.auth_worker.run_device_flow, daemon=True)
-        t.start()
+        self.pool.start(_CallTask(self.auth_worker.run_device_flow))
 
     def _show_code(self, code: str):
         self.code_label.setText(f"CODE: {code}")
@@ -1183,24 +1630,23 @@ class Launcher(QMainWindow):
             self.cfg["msal_logged_in"] = True
             self.cfg["msal_scopes"] = res.get("scope", "")
             # don't store access_token in config; cache file already persists it
-            save_config(self.cfg)
+            self._schedule_save()
             self.login_status.setText("Status: Logged in (token cached)")
-            QMessageBox.information(self, "Login", "Logged in. Token cache saved next to launcher.")
+            self._toast_show("Logged in. Token cache saved next to launcher.", 2500)
         else:
             err = payload.get("error", "unknown")
             self.cfg["msal_logged_in"] = False
-            save_config(self.cfg)
+            self._schedule_save()
             self.login_status.setText("Status: Not logged in")
             if err == "msal_missing":
                 QMessageBox.information(self, "msal missing", "Install:\npython -m pip install msal")
             else:
                 QMessageBox.critical(self, "Login failed", str(err))
 
-    # ----- styles -----
 
-    def _apply_styles(self):
-        # Not transparent buttons, more “client-like” look
-        self.setStyleSheet("""
+# Not transparent buttons, more “client-like” look. Parsed once per process
+# (applied app-wide in main) instead of per Launcher instance.
+_LAUNCHER_QSS = """
         QWidget { color: #EAF3F0; }
 
         #sidebar {
@@ -1344,6 +1790,14 @@ class Launcher(QMainWindow):
             border: 1px solid rgba(255,255,255,0.22);
         }
 
+        QLabel#toast {
+            background: rgba(18, 60, 42, 0.94);
+            border: 1px solid rgba(85,255,164,0.85);
+            border-radius: 12px;
+            padding: 10px 16px;
+            font-weight: 800;
+        }
+
         QPushButton#btnPink {
             background: rgba(255, 107, 214, 1.0);
             color: #200010;
@@ -1351,11 +1805,16 @@ class Launcher(QMainWindow):
             padding: 12px 16px;
             font-weight: 900;
         }
-        """)
+"""
 
 
 def main():
+    # WebEngine is imported lazily (after QApplication exists), so context
+    # sharing for its WebGL viewer must be opted into up front
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
+    app.setStyleSheet(_LAUNCHER_QSS)
+    QPixmapCache.setCacheLimit(10240)  # KB; keep decoded pixmaps across page switches
     win = Launcher()
     win.show()
     sys.exit(app.exec())